@@ -4,6 +4,7 @@ from PyQt6.QtGui import QPainter, QColor, QPen, QFont, QCursor
 from components.inline_editor import InlineEditor
 
 from constants import CELL_HEIGHT, NAME_COL_WIDTH
+from fonts import get_font
 
 class AddUserRow(QWidget):
     """编辑模式下显示在底部的添加行"""
@@ -41,7 +42,7 @@ class AddUserRow(QWidget):
         
         # 文字 "+ 添加"
         painter.setPen(QColor("#888888"))
-        painter.setFont(QFont("Microsoft YaHei", 12))
+        painter.setFont(get_font("Microsoft YaHei", 12))
         painter.drawText(name_rect, Qt.AlignmentFlag.AlignCenter, "+ 添加人员")
 
         # 2. 绘制时间轴单元格 (虚线框)
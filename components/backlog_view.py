@@ -7,6 +7,8 @@ from components.inline_editor import InlineEditor
 
 from models import Task, TaskStatus
 from constants import NAME_COL_WIDTH, CELL_HEIGHT
+from fonts import get_font
+from hit_test import hit_test
 
 class BacklogView(QWidget):
     def __init__(self, tasks: List[Task], parent=None):
@@ -16,25 +18,27 @@ class BacklogView(QWidget):
         self.days = 1
         self.col_widths = [100]
         self.col_offsets = [0]
+        self.col_edges = [0, 100]
         self.date_map = {}
         
         self.setMinimumHeight(150)
         self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
         self.setStyleSheet("BacklogView { background-color: #1F2329; border-top: 2px solid #3A4049; }")
         
-    def update_params(self, start_date: date, days: int, col_widths: List[int], tasks: List[Task]):
+    def update_params(self, start_date: date, days: int, col_widths: List[int],
+                      tasks: List[Task], col_offsets: List[int]):
         self.start_date = start_date
         self.days = days
         self.col_widths = col_widths
         self.tasks = tasks
-        
-        # 计算偏移
-        self.col_offsets = [0] * len(col_widths)
-        curr = 0
-        for i in range(len(col_widths)):
-            self.col_offsets[i] = curr
-            curr += col_widths[i]
-            
+        # 偏移由 rebuild_content 统一算好传入，这里不再做前缀和
+        self.col_offsets = col_offsets
+        # 命中测试用边界：offsets 末尾补上最后一列的右边界
+        if col_widths:
+            self.col_edges = [*col_offsets, col_offsets[-1] + col_widths[-1]]
+        else:
+            self.col_edges = [0]
+
         # 重构日期映射
         self.date_map = {}
         for t in self.tasks:
@@ -64,7 +68,7 @@ class BacklogView(QWidget):
         painter.drawRect(row_header_rect)
         
         painter.setPen(QColor("#FFFFFF"))
-        painter.setFont(QFont("Microsoft YaHei", 10, QFont.Weight.Bold))
+        painter.setFont(get_font("Microsoft YaHei", 10, QFont.Weight.Bold))
         painter.drawText(row_header_rect, Qt.AlignmentFlag.AlignCenter, "不紧急")
 
         # 2. 绘制 7 列网格线
@@ -91,7 +95,7 @@ class BacklogView(QWidget):
             task_rect = QRect(rect.x() + 4, y_offset, rect.width() - 8, row_h)
             
             # 背景
-            bg_color = QColor(task.color) if task.urgent else QColor("#323844")
+            bg_color = task.qcolor() if task.urgent else QColor("#323844")
             painter.fillRect(task_rect, bg_color)
             painter.setPen(QPen(QColor("#3A4049"), 1))
             painter.drawRect(task_rect)
@@ -100,9 +104,8 @@ class BacklogView(QWidget):
             sw_w = 80
             sw_rect = QRect(task_rect.right() - sw_w, task_rect.y(), sw_w, row_h)
             
-            sw_font = QFont("Microsoft YaHei", 7)
-            if task.urgent: sw_font.setWeight(QFont.Weight.Bold)
-            painter.setFont(sw_font)
+            sw_weight = QFont.Weight.Bold if task.urgent else QFont.Weight.Normal
+            painter.setFont(get_font("Microsoft YaHei", 7, sw_weight))
             
             segments = [
                 (TaskStatus.TODO, "待办", "#5B859E"),
@@ -129,13 +132,13 @@ class BacklogView(QWidget):
             text_color = QColor("#FFFFFF") if task.urgent else QColor("#999999")
             painter.setPen(text_color)
             
-            title_font = QFont("Microsoft YaHei", 10)
-            if task.urgent: title_font.setWeight(QFont.Weight.Bold)
+            title_weight = QFont.Weight.Bold if task.urgent else QFont.Weight.Normal
+            title_font = get_font("Microsoft YaHei", 10, title_weight)
             painter.setFont(title_font)
-            
+
             text_rect = task_rect.adjusted(10, 0, -sw_w - 10, 0)
             metrics = painter.fontMetrics()
-            elided_text = metrics.elidedText(task.title, Qt.TextElideMode.ElideRight, text_rect.width())
+            elided_text = task.elided_title(title_font, metrics, text_rect.width())
             painter.drawText(text_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, elided_text)
             
             y_offset += row_h + spacing
@@ -145,12 +148,7 @@ class BacklogView(QWidget):
         if x < NAME_COL_WIDTH: return
         
         # 识别列
-        rel_x = x - NAME_COL_WIDTH
-        col = -1
-        for i, (off, w) in enumerate(zip(self.col_offsets, self.col_widths)):
-            if off <= rel_x < off + w:
-                col = i
-                break
+        col = hit_test(self.col_edges, x - NAME_COL_WIDTH)
         if col == -1: return
         
         target_date = self.start_date + timedelta(days=col)
@@ -8,14 +8,28 @@ from PyQt6.QtMultimedia import QSoundEffect
 from models import Task, TaskStatus
 from constants import CELL_HEIGHT, NAME_COL_WIDTH
 from components.inline_editor import InlineEditor
+from fonts import get_font
+from hit_test import hit_test
+
+# 点击音效全局共享，按需懒加载 (每行各建一个 QSoundEffect 纯属浪费)
+_click_sound = None
+
+def get_click_sound() -> QSoundEffect:
+    global _click_sound
+    if _click_sound is None:
+        _click_sound = QSoundEffect()
+    return _click_sound
 
 class GridPersonRow(QWidget):
-    def __init__(self, person_name: str, tasks: List[Task], 
-                 start_date: date, days: int, col_widths: List[int], parent=None):
+    def __init__(self, person_name: str, tasks: List[Task],
+                 start_date: date, days: int, col_widths: List[int],
+                 col_offsets: List[int], parent=None):
         super().__init__(parent)
         self.person_name, self.tasks, self.start_date, self.days = person_name, tasks, start_date, days
         self.days, self.col_widths = days, col_widths
-        self.col_offsets = self.calculate_offsets()
+        # 偏移由 rebuild_content 统一算好传入，行内不再做前缀和
+        self.col_offsets = col_offsets
+        self.col_edges = self._make_edges(col_offsets, col_widths)
         self._strikethrough_progress = {} # task_id -> progress (0.0 to 1.0)
         self._current_anim_task_id = None # 用于动画属性追踪
         self.update_date_map()
@@ -23,8 +37,8 @@ class GridPersonRow(QWidget):
         # 固定最小宽度为总列宽之和 + 人名列宽
         self.setMinimumWidth(sum(col_widths) + NAME_COL_WIDTH)
         
-        # 初始化音效
-        self.click_sound = QSoundEffect()
+        # 音效 (全局共享实例)
+        self.click_sound = get_click_sound()
 
         # 编辑模式状态
         self.is_edit_mode = False
@@ -34,13 +48,12 @@ class GridPersonRow(QWidget):
         # 删除按钮区域缓存
         self.delete_btn_rect = QRect()
 
-    def calculate_offsets(self):
-        offsets = [0] * len(self.col_widths)
-        curr = 0
-        for i in range(len(self.col_widths)):
-            offsets[i] = curr
-            curr += self.col_widths[i]
-        return offsets
+    @staticmethod
+    def _make_edges(col_offsets, col_widths):
+        # 命中测试用边界：offsets 末尾补上最后一列的右边界
+        if not col_widths:
+            return [0]
+        return [*col_offsets, col_offsets[-1] + col_widths[-1]]
 
     def update_date_map(self):
         self.date_map = {}
@@ -94,11 +107,12 @@ class GridPersonRow(QWidget):
                 self._shake_offset = 0
         self.update()
 
-    def update_tasks(self, tasks, col_widths=None):
+    def update_tasks(self, tasks, col_widths=None, col_offsets=None):
         """核心修复：更新任务列表时必须重构日期映射"""
         if col_widths is not None:
             self.col_widths = col_widths
-            self.col_offsets = self.calculate_offsets()
+            self.col_offsets = col_offsets
+            self.col_edges = self._make_edges(col_offsets, col_widths)
             self.setMinimumWidth(sum(col_widths) + NAME_COL_WIDTH)
         self.tasks = tasks
         self.update_date_map()
@@ -112,7 +126,6 @@ class GridPersonRow(QWidget):
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         painter.fillRect(self.rect(), QColor("#1F2329"))
         
-        # 1. 绘制名字单元格
         # 1. 绘制名字单元格
         name_rect = QRect(0, 0, NAME_COL_WIDTH, CELL_HEIGHT)
         painter.fillRect(name_rect, QColor("#2A3039"))
@@ -124,7 +137,7 @@ class GridPersonRow(QWidget):
         name_text_rect = name_rect.adjusted(5 + int(text_x_offset), 0, -5 + int(text_x_offset), 0)
         
         painter.setPen(QColor("#FFFFFF"))
-        painter.setFont(QFont("Microsoft YaHei", 10, QFont.Weight.Bold))
+        painter.setFont(get_font("Microsoft YaHei", 10, QFont.Weight.Bold))
         painter.drawText(name_text_rect, Qt.AlignmentFlag.AlignCenter, self.person_name)
         
         # 编辑模式：绘制删除按钮
@@ -181,12 +194,7 @@ class GridPersonRow(QWidget):
         if x < NAME_COL_WIDTH: return
         
         # 识别具体的列
-        col = -1
-        rel_x = x - NAME_COL_WIDTH
-        for i, (off, w) in enumerate(zip(self.col_offsets, self.col_widths)):
-            if off <= rel_x < off + w:
-                col = i
-                break
+        col = hit_test(self.col_edges, x - NAME_COL_WIDTH)
         if col == -1: return
         
         target_date = self.start_date + timedelta(days=col)
@@ -299,7 +307,7 @@ class GridPersonRow(QWidget):
             
             # 1. 背景
             painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-            bg_color = QColor(task.color) if task.urgent else QColor("#323844")
+            bg_color = task.qcolor() if task.urgent else QColor("#323844")
             painter.fillRect(task_rect, bg_color)
             
             # 2. 绘制右侧状态开关 (待办 | 阻塞 | 完成) - 使用小字体
@@ -307,9 +315,8 @@ class GridPersonRow(QWidget):
             sw_rect = QRect(task_rect.right() - sw_w, y, sw_w, block_h)
             
             # 非紧急任务移除 Bold
-            sw_font = QFont("Microsoft YaHei", 7)
-            if task.urgent: sw_font.setWeight(QFont.Weight.Bold)
-            painter.setFont(sw_font)
+            sw_weight = QFont.Weight.Bold if task.urgent else QFont.Weight.Normal
+            painter.setFont(get_font("Microsoft YaHei", 7, sw_weight))
             
             segments = [
                 (TaskStatus.TODO, "待办", "#5B859E"),
@@ -343,13 +350,13 @@ class GridPersonRow(QWidget):
             text_color = QColor("#FFFFFF") if task.urgent else QColor("#999999")
             painter.setPen(text_color)
             
-            title_font = QFont("Microsoft YaHei", 12)
-            if task.urgent: title_font.setWeight(QFont.Weight.Bold)
+            title_weight = QFont.Weight.Bold if task.urgent else QFont.Weight.Normal
+            title_font = get_font("Microsoft YaHei", 12, title_weight)
             painter.setFont(title_font)
-            
+
             text_rect = task_rect.adjusted(12, 0, -sw_w - 5, 0)
             metrics = painter.fontMetrics()
-            elided_text = metrics.elidedText(task.title, Qt.TextElideMode.ElideRight, text_rect.width())
+            elided_text = task.elided_title(title_font, metrics, text_rect.width())
             painter.drawText(text_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, elided_text)
             
             # 5. 划线动画 (如果是已完成)
@@ -6,6 +6,7 @@ from PyQt6.QtGui import QPainter, QColor, QPen, QFont
 
 from models import ViewMode
 from constants import NAME_COL_WIDTH
+from fonts import get_font
 
 class ModeHeader(QWidget):
     def __init__(self, start_date: date, days: int, col_widths: List[int], mode: ViewMode, parent=None):
@@ -40,7 +41,7 @@ class ModeHeader(QWidget):
             painter.setPen(QPen(QColor("#3A4049"), 1))
             painter.drawRect(header_rect)
             painter.setPen(QColor("#888888"))
-            painter.setFont(QFont("Microsoft YaHei", 9, QFont.Weight.Bold))
+            painter.setFont(get_font("Microsoft YaHei", 9, QFont.Weight.Bold))
             
             if self.mode == ViewMode.SIDEBAR:
                 title = "今日任务 (TODAY)"
@@ -0,0 +1,16 @@
+# 全局字体缓存
+# QFont 构造会触碰字体数据库查询，绘制热路径里每帧新建纯属浪费。
+# 注意：缓存返回的是共享实例，调用方不得再 setWeight/setPointSize 修改。
+import functools
+
+from PyQt6.QtGui import QFont, QFontMetrics
+
+
+@functools.lru_cache(maxsize=16)
+def get_font(family: str, size: int, weight: QFont.Weight = QFont.Weight.Normal) -> QFont:
+    return QFont(family, size, weight)
+
+
+@functools.lru_cache(maxsize=16)
+def get_metrics(family: str, size: int, weight: QFont.Weight = QFont.Weight.Normal) -> QFontMetrics:
+    return QFontMetrics(get_font(family, size, weight))
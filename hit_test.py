@@ -0,0 +1,15 @@
+"""列命中测试共享工具。
+
+edges 是列边界的前缀和 (比 offsets 多一个末尾右边界)，
+bisect 二分定位比逐列线性扫描快，且各视图共用同一份实现。
+刻意保持纯 Python：列数只有个位数到两位数，Numba 之类的 JIT
+在这个规模下光预热开销就远超收益。
+"""
+from bisect import bisect_right
+from typing import List
+
+
+def hit_test(edges: List[int], x: float) -> int:
+    """返回 x 落在哪一列，越界返回 -1"""
+    i = bisect_right(edges, x) - 1
+    return i if 0 <= i < len(edges) - 1 else -1
@@ -2,6 +2,7 @@
 import sys
 import os
 from datetime import date, timedelta
+from itertools import accumulate
 from typing import List
 
 from PyQt6.QtWidgets import (
@@ -10,7 +11,7 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt, QRect, QTimer, QPropertyAnimation, QEasingCurve, QPoint, pyqtProperty, QUrl
 from PyQt6.QtMultimedia import QSoundEffect
-from PyQt6.QtGui import QPainter, QColor, QPen, QFont, QCursor, QFontMetrics
+from PyQt6.QtGui import QPainter, QColor, QPen, QFont, QCursor, QFontMetrics, QImage
 
 # Import modular components and models
 from models import ViewMode, TaskStatus, Task
@@ -21,6 +22,15 @@ from components.header import ModeHeader
 from components.backlog_view import BacklogView
 from components.add_user_row import AddUserRow
 from storage import DataManager
+from fonts import get_font, get_metrics
+from hit_test import hit_test
+
+# 拖拽幽灵块宽度 (两种模式下)
+GHOST_W_SIDE = CELL_WIDTH_SIDE - 20
+GHOST_W_FULL = CELL_WIDTH_FULL - 20
+
+# 标题参与列宽计算的宽度上限，防止病态长标题把列撑爆
+MAX_TITLE_W = 400
 
 class ScheduleView(QMainWindow):
     def __init__(self):
@@ -41,26 +51,88 @@ class ScheduleView(QMainWindow):
         self.collapse_timer = QTimer()
         self.collapse_timer.setSingleShot(True)
         self.collapse_timer.timeout.connect(self.collapse_sidebar)
+
+        # 动画实例常驻：每次过渡都新建 QPropertyAnimation 的对象/信号接线开销
+        # 不小，且旧实例被 GC 回收时可能引起闪烁。调用处只重设终值再 start。
+        self.geo_anim = QPropertyAnimation(self, b"geometry")
+        self.geo_anim.setDuration(400)
+        self.geo_anim.setEasingCurve(QEasingCurve.Type.InOutCubic)
+        self.opa_anim = QPropertyAnimation(self, b"windowOpacity")
+        self.opa_anim.setDuration(400)
+        self.opa_anim.setEasingCurve(QEasingCurve.Type.InOutCubic)
+        self.coll_anim = QPropertyAnimation(self, b"geometry")
+        self.coll_anim.setDuration(250)
+        self.coll_anim.setEasingCurve(QEasingCurve.Type.OutQuad)
+        self.exp_anim = QPropertyAnimation(self, b"geometry")
+        self.exp_anim.setDuration(200)
+        self.exp_anim.setEasingCurve(QEasingCurve.Type.OutQuad)
+
+        # 几何动画期间 moveEvent 每帧触发，单个布尔位比逐帧查询动画状态便宜
+        self._anim_running = False
+        for anim in (self.geo_anim, self.coll_anim, self.exp_anim):
+            anim.finished.connect(self._on_geo_anim_finished)
         
         self.sidebar_geometry = QRect()
         self.fullscreen_geometry = QRect()
         self.all_tasks = []
+        self.col_edges = [0]
+
+        # 表头与人员行的直接引用，避免每次重建都线性扫描布局 + isinstance
+        self._header = None
+        self._person_rows: dict[str, GridPersonRow] = {}
+        # 行组件对象池：重建时隐藏复用而不是 deleteLater + 重新构造
+        self._row_pool: list[GridPersonRow] = []
+        # 每行内容签名，内容未变时跳过 update_tasks/重绘
+        self._row_sigs: dict[str, tuple] = {}
+
+        # 重建合并：同一事件循环内的多次 rebuild_content 只真正执行一次
+        self._rebuild_pending = False
+        self._pending_rebuild_args = (True, 400)
+
+        # 列宽测量所用的字体度量，常驻实例 (文字测量是 Qt 里的大开销)
+        self._metrics = get_metrics("Microsoft YaHei", 12, QFont.Weight.Bold)
+
+        # 列宽记忆化：拖拽过程中标题集合不变，重建间结果完全相同
+        self._colw_cache: dict[tuple, int] = {}
+
+        # 上一次 rebuild_content 时的模式，用于跳过纯视觉状态切换的重建
+        self._built_mode = None
         
         # 拖拽全局状态
         self.dragging_task = None
         self.drag_ghost_pos = QPoint()
         self.drag_origin_row = None
         self.drag_target_info = None # (person_name, date)
-        
-        self.drag_target_info = None # (person_name, date)
-        
+
+        # 拖拽预览节流：鼠标事件可能快于刷新率，合并到 ~60Hz 处理一次
+        self._pending_drag_point = None
+        self._last_ghost_rect = QRect()
+
+        # 幽灵块绘制资源常驻，避免每帧构造 QPen/QFont
+        self._ghost_pen = QPen(Qt.GlobalColor.white, 1)
+        self._ghost_font = get_font("Microsoft YaHei", 10)
+        # 拖拽开始时一次性栅格化的幽灵块贴图
+        self._ghost_img = None
+        self._drag_tick = QTimer(self)
+        self._drag_tick.setSingleShot(True)
+        self._drag_tick.setInterval(16)
+        self._drag_tick.timeout.connect(self._apply_pending_drag)
+
         self.data_manager = DataManager()
         self.data_manager.load_data()
+        # 退出前把防抖窗口内挂起的变更落盘
+        QApplication.instance().aboutToQuit.connect(self.data_manager.flush)
         
         self.init_ui()
-        
+
+        # 缓存屏幕可用区域：每次 rebuild/折叠都查询 Qt 屏幕 API 是浪费，
+        # 只在屏幕几何真正变化时经信号刷新
+        self._screen = QApplication.primaryScreen()
+        self._screen_geom = self._screen.availableGeometry()
+        self._screen.availableGeometryChanged.connect(self._on_screen_geometry_changed)
+
         # 记录初始几何位置
-        screen = QApplication.primaryScreen().availableGeometry()
+        screen = self._screen_geom
         self.current_y = (screen.height() - 500) // 2
         
         # 预先隐藏，确保所有初始化完成后再一次性显示
@@ -87,7 +159,6 @@ class ScheduleView(QMainWindow):
         self.main_layout.setContentsMargins(0, 0, 0, 0)
         self.main_layout.setSpacing(0)
         
-        # 使用自定义标题栏
         # 使用自定义标题栏
         self.custom_title_bar = CustomTitleBar(self)
         self.custom_title_bar.edit_mode_toggled.connect(self.toggle_edit_mode)
@@ -115,8 +186,6 @@ class ScheduleView(QMainWindow):
         self.container_layout.setSpacing(1)
         self.scroll.setWidget(self.container)
         
-        # 垂直分割：上方是网格，下方是不紧急任务
-        self.backlog_view = BacklogView([])
         self.main_layout.addWidget(self.scroll, stretch=1)
         
         # 添加用户行 (初始化但不添加到主布局，而是放入 container)
@@ -124,6 +193,7 @@ class ScheduleView(QMainWindow):
         self.add_user_row.hide()
         self.add_user_row.add_user_requested.connect(self.add_user)
         
+        # 垂直分割：上方是网格，下方是不紧急任务
         self.backlog_view = BacklogView([])
         self.main_layout.addWidget(self.backlog_view)
 
@@ -136,8 +206,7 @@ class ScheduleView(QMainWindow):
         self.rebuild_content()
 
     def add_task(self, task):
-        self.data_manager.tasks.append(task)
-        self.data_manager.save_data()
+        self.data_manager.add_task(task)
         self.rebuild_content()
 
     def save_data(self):
@@ -154,59 +223,88 @@ class ScheduleView(QMainWindow):
                 self.toggle_edit_mode(True) 
                 break
 
-    def rebuild_content(self, animate=True):
+    def rebuild_content(self, animate=True, anim_duration=400):
+        """重建入口：把紧挨着的多次调用合并成一次 _do_rebuild"""
+        self._pending_rebuild_args = (animate, anim_duration)
+        if not self.isVisible():
+            # 初始化路径需要同步拿到几何计算结果
+            self._flush_rebuild()
+            return
+        if self._rebuild_pending:
+            return
+        self._rebuild_pending = True
+        QTimer.singleShot(0, self._flush_rebuild)
+
+    def _flush_rebuild(self):
+        self._rebuild_pending = False
+        animate, anim_duration = self._pending_rebuild_args
+        self._do_rebuild(animate=animate, anim_duration=anim_duration)
+
+    def _do_rebuild(self, animate=True, anim_duration=400):
         """流式更新内容，适配父窗体拉伸"""
         today = date.today()
         days = 1 if self.current_mode == ViewMode.SIDEBAR else 7
         
         # 从 DataManager 获取数据
         active_users = [u for u in self.data_manager.users if u.is_active]
-        all_tasks = self.data_manager.tasks
-        
-        # 筛选已排期和未排期任务
-        scheduled_tasks = [t for t in all_tasks if t.scheduled]
-        backlog_tasks = [t for t in all_tasks if not t.scheduled]
-        
+        all_tasks = self.data_manager.get_all_tasks()
         active_user_names = {u.name for u in active_users}
 
+        # 单次遍历完成 待办/按日/按人 三种分桶，
+        # 取代原来 2 + days + persons 次的列表推导扫描
+        backlog_tasks = []
+        by_day = {}     # 列宽计算用：当天所有可见任务 (含不紧急，排除已删用户)
+        by_person = {u.name: [] for u in active_users}
+        for t in all_tasks:
+            if not t.person or t.person in active_user_names:
+                by_day.setdefault(t.date, []).append(t)
+            if not t.scheduled:
+                backlog_tasks.append(t)
+            elif t.person in by_person:
+                by_person[t.person].append(t)
+
         # 0. 计算动态列宽 (必须在更新 BacklogView 前计算，因为 BacklogView 需要对齐)
         self.col_widths = []
-        metrics = QFontMetrics(QFont("Microsoft YaHei", 12, QFont.Weight.Bold))
+        metrics = self._metrics
         for i in range(days):
             target_date = today + timedelta(days=i)
-            # 关键修复：计算列宽时应考虑当天所有任务（含不紧急任务）
-            # 但排除已删除用户的任务
-            tasks_on_day = [
-                t for t in all_tasks 
-                if t.date == target_date and (not t.person or t.person in active_user_names)
-            ]
+            tasks_on_day = by_day.get(target_date, ())
             if not tasks_on_day:
-                w = 80 
+                w = 80
             else:
-                max_txt_w = 0
-                for t in tasks_on_day:
-                    max_txt_w = max(max_txt_w, metrics.horizontalAdvance(t.title))
-                w = max_txt_w + 80 + 30 
-                min_w = 120 if self.current_mode == ViewMode.FULLSCREEN else 180
-                w = max(min_w, w)
+                cache_key = (self.current_mode, target_date,
+                             tuple(sorted(t.title for t in tasks_on_day)))
+                w = self._colw_cache.get(cache_key)
+                if w is None:
+                    max_txt_w = min(MAX_TITLE_W, max(t.title_width(metrics) for t in tasks_on_day))
+                    w = max_txt_w + 80 + 30
+                    min_w = 120 if self.current_mode == ViewMode.FULLSCREEN else 180
+                    w = max(min_w, w)
+                    # 简单的 FIFO 淘汰，防止长期运行下缓存无界增长
+                    if len(self._colw_cache) >= 256:
+                        self._colw_cache.pop(next(iter(self._colw_cache)))
+                    self._colw_cache[cache_key] = w
             self.col_widths.append(w)
 
+        # 列偏移前缀和只算一次，行/表头/Backlog 共享同一份；
+        # edges 比 offsets 多末尾右边界，供 bisect 命中测试直接使用
+        self.col_edges = [0, *accumulate(self.col_widths)]
+        self.col_offsets = self.col_edges[:-1]
+
         # 1. 更新 BacklogView
-        self.backlog_view.update_params(today, days, self.col_widths, backlog_tasks)
+        self.backlog_view.update_params(today, days, self.col_widths, backlog_tasks,
+                                        col_offsets=self.col_offsets)
         
         # 1. 更新表头
         total_grid_w = sum(self.col_widths) + NAME_COL_WIDTH
-        if self.container_layout.count() > 0:
-            header = self.container_layout.itemAt(0).widget()
-            if isinstance(header, ModeHeader):
-                header.days, header.col_widths, header.mode = days, self.col_widths, self.current_mode
-                header.setFixedWidth(total_grid_w)
-                header.update()
-            else:
-                self.clear_layout()
-                self.container_layout.addWidget(ModeHeader(today, days, self.col_widths, self.current_mode))
+        if self._header is None:
+            self._header = ModeHeader(today, days, self.col_widths, self.current_mode)
+            self.container_layout.addWidget(self._header)
         else:
-            self.container_layout.addWidget(ModeHeader(today, days, self.col_widths, self.current_mode))
+            header = self._header
+            header.days, header.col_widths, header.mode = days, self.col_widths, self.current_mode
+            header.setFixedWidth(total_grid_w)
+            header.update()
 
         # 设置容器固定宽度，消除布局自动拉伸带来的对齐误差
         self.container.setFixedWidth(total_grid_w)
@@ -214,24 +312,47 @@ class ScheduleView(QMainWindow):
         # 2. 更新人员行
         persons = [u for u in self.data_manager.users if u.is_active]
         
-        # 简单暴力的全量重建策略 (为了正确反映添加/删除)
-        # 清理旧 ROW (除了第一个 header) - 从后往前删比较安全
+        # 行组件池化复用：只从布局摘下，不销毁重建 (widget 拆建是大头)
+        old_rows = dict(self._person_rows)
+        self._person_rows.clear()
         while self.container_layout.count() > 1:
             item = self.container_layout.takeAt(1)
             widget = item.widget()
-            if widget:
-                if widget == self.add_user_row:
-                    widget.setParent(None) # 只是从布局移除，不销毁
-                else:
-                    widget.deleteLater()
-            elif item.spacerItem():
-                pass # 忽略弹簧
-
+            if widget is None:
+                continue # 忽略弹簧
+            if widget is self.add_user_row:
+                widget.setParent(None) # 只是从布局移除，不销毁
+            elif not isinstance(widget, GridPersonRow):
+                widget.deleteLater()
+
+        edit_mode = self.custom_title_bar.people_btn.isChecked()
         for p in persons:
-            p_tasks = [t for t in scheduled_tasks if t.person == p.name] # 暂时用名字关联
-            row = GridPersonRow(p.name, p_tasks, today, days, self.col_widths)
-            row.set_edit_mode(self.custom_title_bar.people_btn.isChecked()) # 保持编辑状态
+            p_tasks = by_person[p.name] # 暂时用名字关联
+            new_sig = (today, days, tuple(self.col_widths),
+                       tuple((t.id, t.date, t.status, t.urgent) for t in p_tasks))
+            row = old_rows.pop(p.name, None)
+            reused_same_person = row is not None
+            if row is None and self._row_pool:
+                row = self._row_pool.pop()
+                row.person_name = p.name
+            if row is None:
+                row = GridPersonRow(p.name, p_tasks, today, days, self.col_widths,
+                                    col_offsets=self.col_offsets)
+            elif not reused_same_person or self._row_sigs.get(p.name) != new_sig:
+                row.start_date, row.days = today, days
+                row.update_tasks(p_tasks, self.col_widths, self.col_offsets)
+            self._row_sigs[p.name] = new_sig
+            # 状态没变就别调：set_edit_mode 会无条件重绘并重启抖动动画
+            if row.is_edit_mode != edit_mode:
+                row.set_edit_mode(edit_mode)
+            row.show()
             self.container_layout.addWidget(row)
+            self._person_rows[p.name] = row
+
+        # 本轮未用到的行退回对象池
+        for row in old_rows.values():
+            row.hide()
+            self._row_pool.append(row)
 
         # 3. 如果在编辑模式，在最后添加 AddUserRow
         if self.custom_title_bar.people_btn.isChecked():
@@ -242,18 +363,13 @@ class ScheduleView(QMainWindow):
         else:
             self.add_user_row.hide()
 
-        # 4. 底部弹簧
-        if self.container_layout.count() > 0:
-            last = self.container_layout.itemAt(self.container_layout.count()-1)
-            if not last or not last.spacerItem(): self.container_layout.addStretch()
-        
-        self.update()
+        # 4. 底部弹簧：上面的清理循环已把旧弹簧连同行一起摘除，直接补一个即可
+        self.container_layout.addStretch()
 
-        if self.container_layout.count() > 0 and not isinstance(self.container_layout.itemAt(self.container_layout.count()-1), QWidget):
-             self.container_layout.addStretch()
+        self.update()
 
         # 5. 同步窗口几何尺寸 (通过动画应用，且始终保持右侧贴边)
-        screen = QApplication.primaryScreen().availableGeometry()
+        screen = self._screen_geom
         
         # 计算理想高度: 标题栏(35) + 表头(40) + 人行(N*CELL_HEIGHT) + AddRow(50?) + Backlog(动态) + 边距
         toolbar_h = 0
@@ -271,34 +387,34 @@ class ScheduleView(QMainWindow):
         fullscreen_w = max(400, min(screen.width() - 50, total_grid_w + 2))
         self.fullscreen_geometry = QRect(screen.width() - fullscreen_w, self.current_y, fullscreen_w, target_h)
 
+        self._built_mode = self.current_mode
+
         # 应用几何更新
         if not self.is_collapsed:
             target_geo = self.sidebar_geometry if self.current_mode == ViewMode.SIDEBAR else self.fullscreen_geometry
             if animate:
-                self.apply_geometry_animation(target_geo)
+                self.apply_geometry_animation(target_geo, duration=anim_duration)
             else:
                 self.setGeometry(target_geo)
 
-    def apply_geometry_animation(self, target_geo: QRect):
+    def apply_geometry_animation(self, target_geo: QRect, duration: int = 400):
         """统一的宽度/位置平滑过渡动画"""
         if self.geometry() == target_geo: return
-        
+
         # 如果已经有动画在运行且目标一致，则跳过
-        if hasattr(self, "geo_anim") and self.geo_anim.state() == QPropertyAnimation.State.Running:
+        if self.geo_anim.state() == QPropertyAnimation.State.Running:
             if self.geo_anim.endValue() == target_geo:
                 return
             self.geo_anim.stop()
 
-        self.geo_anim = QPropertyAnimation(self, b"geometry")
-        self.geo_anim.setDuration(400)
-        self.geo_anim.setEasingCurve(QEasingCurve.Type.InOutCubic)
+        self.geo_anim.setDuration(duration)
+        self.geo_anim.setStartValue(self.geometry())
         self.geo_anim.setEndValue(target_geo)
+        self._anim_running = True
         self.geo_anim.start()
 
-    def clear_layout(self):
-        while self.container_layout.count():
-            item = self.container_layout.takeAt(0)
-            if item.widget(): item.widget().deleteLater()
+    def _on_geo_anim_finished(self):
+        self._anim_running = False
 
     def toggle_view_mode(self):
         self.animate_transition(ViewMode.SIDEBAR if self.current_mode == ViewMode.FULLSCREEN else ViewMode.FULLSCREEN)
@@ -314,42 +430,30 @@ class ScheduleView(QMainWindow):
 
     def animate_transition(self, target_mode: ViewMode):
         if self.is_collapsed: self.expand_sidebar()
-        
-        # 1. 启动透明度动画
-        target_opacity = 1.0 if target_mode == ViewMode.FULLSCREEN else 0.85
-        self.opa_anim = QPropertyAnimation(self, b"windowOpacity")
-        self.opa_anim.setDuration(400)
-        self.opa_anim.setEasingCurve(QEasingCurve.Type.InOutCubic)
-        self.opa_anim.setEndValue(target_opacity)
-        self.opa_anim.start()
 
-        # 2. 更新模式和UI状态 (这会触发 rebuild_content -> apply_geometry_animation)
+        # 透明度动画由 update_ui_state 统一启动
+        # 更新模式和UI状态 (这会触发 rebuild_content -> apply_geometry_animation)
         self.current_mode = target_mode
         self.update_ui_state(target_mode)
 
     def moveEvent(self, event):
         """移动窗口时记录 Y 坐标，用于跟随模式切换"""
         super().moveEvent(event)
-        # 如果不是在执行动画，且没有折叠，记录 Y
-        if not self.is_collapsed:
-            is_geo_anim = hasattr(self, "geo_anim") and self.geo_anim.state() == QPropertyAnimation.State.Running
-            is_exp_anim = hasattr(self, "exp_anim") and self.exp_anim.state() == QPropertyAnimation.State.Running
-            if not is_geo_anim and not is_exp_anim:
-                self.current_y = self.y()
-                # 同时更新几何缓存，防止 rebuild 被旧值覆写
-                if hasattr(self, "sidebar_geometry"):
-                    self.sidebar_geometry.moveTop(self.current_y)
-                if hasattr(self, "fullscreen_geometry"):
-                    self.fullscreen_geometry.moveTop(self.current_y)
+        # 动画或折叠期间不记录，直接短路
+        if self._anim_running or self.is_collapsed:
+            return
+        self.current_y = self.y()
+        # 同时更新几何缓存，防止 rebuild 被旧值覆写
+        self.sidebar_geometry.moveTop(self.current_y)
+        self.fullscreen_geometry.moveTop(self.current_y)
 
     def update_ui_state(self, mode: ViewMode, animate=True):
         """更新状态 (任务栏可见性、置顶、按钮、可见性)"""
         # 1. 透明度动画
         target_opacity = 1.0 if mode == ViewMode.FULLSCREEN else 0.85
         if animate:
-            self.opa_anim = QPropertyAnimation(self, b"windowOpacity")
-            self.opa_anim.setDuration(400)
-            self.opa_anim.setEasingCurve(QEasingCurve.Type.InOutCubic)
+            self.opa_anim.stop()
+            self.opa_anim.setStartValue(self.windowOpacity())
             self.opa_anim.setEndValue(target_opacity)
             self.opa_anim.start()
         else:
@@ -394,7 +498,15 @@ class ScheduleView(QMainWindow):
             self.pin_btn.setChecked(False)
             self.setMouseTracking(False)
         
-        self.rebuild_content(animate=animate)
+        # 仅当布局真正变化 (天数随模式改变) 时才重建；纯透明度/按钮状态切换跳过
+        if self._needs_layout_rebuild(mode):
+            self.rebuild_content(animate=animate)
+
+    def _needs_layout_rebuild(self, mode: ViewMode) -> bool:
+        return self._built_mode != mode
+
+    def _on_screen_geometry_changed(self, *_):
+        self._screen_geom = self._screen.availableGeometry()
 
     def enterEvent(self, event):
         if self.current_mode == ViewMode.SIDEBAR and self.is_collapsed: self.expand_sidebar()
@@ -408,27 +520,27 @@ class ScheduleView(QMainWindow):
     def collapse_sidebar(self):
         if self.current_mode != ViewMode.SIDEBAR or self.is_collapsed or self.is_pinned: return
         self.is_collapsed = True
-        screen = QApplication.primaryScreen().availableGeometry()
+        screen = self._screen_geom
         
-        self.coll_anim = QPropertyAnimation(self, b"geometry")
-        self.coll_anim.setDuration(250)
-        self.coll_anim.setEasingCurve(QEasingCurve.Type.OutQuad)
+        self.coll_anim.stop()
         target_rect = QRect(screen.width() - self.collapsed_width, self.y(), self.collapsed_width, self.height())
+        self.coll_anim.setStartValue(self.geometry())
         self.coll_anim.setEndValue(target_rect)
         
         QTimer.singleShot(150, lambda: self.main_widget.hide() if self.is_collapsed else None)
+        self._anim_running = True
         self.coll_anim.start()
 
     def expand_sidebar(self):
         if not self.is_collapsed: return
         self.is_collapsed = False
         
-        self.exp_anim = QPropertyAnimation(self, b"geometry")
-        self.exp_anim.setDuration(200)
-        self.exp_anim.setEasingCurve(QEasingCurve.Type.OutQuad)
+        self.exp_anim.stop()
+        self.exp_anim.setStartValue(self.geometry())
         self.exp_anim.setEndValue(self.sidebar_geometry)
         
         self.main_widget.show()
+        self._anim_running = True
         self.exp_anim.start()
 
     # --- 拖拽系统实现 ---
@@ -436,20 +548,61 @@ class ScheduleView(QMainWindow):
         self.dragging_task = task
         self.drag_origin_row = row_widget
         self.drag_offset = offset
+        self._ghost_img = self._render_ghost(task)
         self.setCursor(Qt.CursorShape.ClosedHandCursor)
         self.grabMouse()
         self.update()
 
+    def _render_ghost(self, task) -> QImage:
+        """幽灵块只在拖拽开始时栅格化一次，拖动期间直接贴图。
+        目标用 QImage (预乘 ARGB)，纯 CPU 栅格化，不经过窗口表面。"""
+        w = GHOST_W_SIDE if self.current_mode == ViewMode.SIDEBAR else GHOST_W_FULL
+        img = QImage(w, 24, QImage.Format.Format_ARGB32_Premultiplied)
+        img.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(img)
+        # 轴对齐矩形不需要抗锯齿
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+        rect = QRect(0, 0, w, 24)
+        painter.fillRect(rect, task.qcolor())
+        painter.setPen(self._ghost_pen)
+        painter.setFont(self._ghost_font)
+        painter.drawRect(rect.adjusted(0, 0, -1, -1))
+        painter.drawText(rect.adjusted(5, 0, 0, 0),
+                         Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, task.title)
+        painter.end()
+        return img
+
     def mouseMoveEvent(self, event):
         if self.dragging_task:
-            self.drag_ghost_pos = event.position().toPoint() - self.drag_offset
-            self.update_drag_preview(event.position().toPoint())
-            self.update()
+            # 只记录最新位置，按节流定时器的节奏做真正的预览计算
+            self._pending_drag_point = event.position().toPoint()
+            if not self._drag_tick.isActive():
+                self._drag_tick.start()
         super().mouseMoveEvent(event)
 
+    def _apply_pending_drag(self):
+        if not self.dragging_task or self._pending_drag_point is None:
+            return
+        point = self._pending_drag_point
+        self.drag_ghost_pos = point - self.drag_offset
+        self.update_drag_preview(point)
+        # 只无效化新旧幽灵块覆盖的区域，避免整窗重绘
+        new_rect = self._ghost_rect()
+        self.update(self._last_ghost_rect.united(new_rect).adjusted(-2, -2, 2, 2))
+        self._last_ghost_rect = new_rect
+
+    def _ghost_rect(self) -> QRect:
+        w = GHOST_W_SIDE if self.current_mode == ViewMode.SIDEBAR else GHOST_W_FULL
+        return QRect(self.drag_ghost_pos.x(), self.drag_ghost_pos.y(), w, 24)
+
     def mouseReleaseEvent(self, event):
         if self.dragging_task:
             self.releaseMouse()
+            # 用释放点把挂起的预览计算冲掉：节流定时器最多滞后 16ms，
+            # 快速一甩甚至一个 tick 都没跑过，落点必须按最终位置算
+            self._drag_tick.stop()
+            self._pending_drag_point = event.position().toPoint()
+            self._apply_pending_drag()
             self.finalize_task_drag()
             self.setCursor(Qt.CursorShape.ArrowCursor)
         super().mouseReleaseEvent(event)
@@ -460,11 +613,8 @@ class ScheduleView(QMainWindow):
             # 识别 backlog 中的具体日期列
             backlog_local_x = rel_pos.x() - self.backlog_view.x() - NAME_COL_WIDTH
             if backlog_local_x >= 0:
-                col = -1
-                for i, (off, w) in enumerate(zip(self.backlog_view.col_offsets, self.backlog_view.col_widths)):
-                    if off <= backlog_local_x < off + w:
-                        col = i
-                        break
+                # 二分查找列 (edges 是有序边界，线性扫描在鼠标移动频率下浪费)
+                col = hit_test(self.col_edges, backlog_local_x)
                 if col != -1:
                     target_date = self.backlog_view.start_date + timedelta(days=col)
                     self.drag_target_info = ("BACKLOG", target_date)
@@ -476,22 +626,17 @@ class ScheduleView(QMainWindow):
 
         local_pos = self.scroll.widget().mapFromGlobal(self.mapToGlobal(global_point))
         target_row = None
-        for i in range(1, self.container_layout.count()):
-            w = self.container_layout.itemAt(i).widget()
-            if isinstance(w, GridPersonRow):
-                if w.geometry().contains(local_pos):
-                    target_row = w
-                    break
-        
+        for w in self._person_rows.values():
+            if w.geometry().contains(local_pos):
+                target_row = w
+                break
+
         if target_row:
             x_in_row = local_pos.x() - target_row.x() - NAME_COL_WIDTH
             if x_in_row >= 0:
-                col = -1
-                for i, (off, w) in enumerate(zip(target_row.col_offsets, target_row.col_widths)):
-                    if off <= x_in_row < off + w:
-                        col = i
-                        break
-                
+                # 同样使用二分查找定位列
+                col = hit_test(self.col_edges, x_in_row)
+
                 if col != -1:
                     target_date = target_row.start_date + timedelta(days=col)
                     self.drag_target_info = (target_row.person_name, target_date)
@@ -507,11 +652,11 @@ class ScheduleView(QMainWindow):
             self.dragging_task.scheduled = False
             self.dragging_task.person = ""
             self.dragging_task.date = self.drag_target_info[1]
-            self.rebuild_content()
+            self.rebuild_content(anim_duration=150)
         elif self.drag_target_info == "BACKLOG":
             self.dragging_task.scheduled = False
             self.dragging_task.person = ""
-            self.rebuild_content()
+            self.rebuild_content(anim_duration=150)
         elif self.drag_target_info:
             target_p, target_d = self.drag_target_info
             
@@ -521,13 +666,11 @@ class ScheduleView(QMainWindow):
             self.dragging_task.status = TaskStatus.TODO
             
             # 清除划线进度
-            for i in range(1, self.container_layout.count()):
-                w = self.container_layout.itemAt(i).widget()
-                if isinstance(w, GridPersonRow):
-                    if self.dragging_task.id in w._strikethrough_progress:
-                        w._strikethrough_progress[self.dragging_task.id] = 0.0
-            
-            self.rebuild_content()
+            for w in self._person_rows.values():
+                if self.dragging_task.id in w._strikethrough_progress:
+                    w._strikethrough_progress[self.dragging_task.id] = 0.0
+
+            self.rebuild_content(anim_duration=150)
         
         self.data_manager.save_data() # 保存拖拽变更
         self.dragging_task = None
@@ -535,16 +678,17 @@ class ScheduleView(QMainWindow):
         self.update()
 
     def paintEvent(self, event):
+        # 空闲时 (没有拖拽) 子组件的每次 update 都会走到这里，尽早返回
+        if not self.dragging_task:
+            return super().paintEvent(event)
         super().paintEvent(event)
-        if self.dragging_task:
-            painter = QPainter(self)
-            painter.setOpacity(0.7)
-            w = CELL_WIDTH_SIDE - 20 if self.current_mode == ViewMode.SIDEBAR else CELL_WIDTH_FULL - 20
-            rect = QRect(self.drag_ghost_pos.x(), self.drag_ghost_pos.y(), int(w), 24)
-            painter.fillRect(rect, QColor(self.dragging_task.color))
-            painter.setPen(QPen(Qt.GlobalColor.white, 1))
-            painter.drawRect(rect)
-            painter.drawText(rect.adjusted(5,0,0,0), Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, self.dragging_task.title)
+        rect = self._ghost_rect()
+        # 脏区域不含幽灵块时跳过覆盖绘制
+        if not event.rect().intersects(rect.adjusted(-2, -2, 2, 2)):
+            return
+        painter = QPainter(self)
+        painter.setOpacity(0.7)
+        painter.drawImage(self.drag_ghost_pos, self._ghost_img)
 
 if __name__ == "__main__":
     if sys.platform == "linux": os.environ["QT_QPA_PLATFORM"] = "xcb"
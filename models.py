@@ -1,7 +1,16 @@
 from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date
-import uuid
+from functools import lru_cache
+import os
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QColor
+
+@lru_cache(maxsize=4096)
+def _iso(d: date) -> str:
+    # 批量序列化时大量任务共享同一天，isoformat 只算一次
+    return d.isoformat()
 
 class ViewMode(Enum):
     SIDEBAR = 1      
@@ -12,7 +21,7 @@ class TaskStatus(Enum):
     BLOCKED = "阻塞中"
     DONE = "已完成"
 
-@dataclass
+@dataclass(slots=True)
 class User:
     emp_id: str
     name: str
@@ -36,7 +45,7 @@ class User:
             avatar=data.get("avatar", "")
         )
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     title: str
     person: str
@@ -48,17 +57,43 @@ class Task:
     scheduled: bool = True
     urgent: bool = True # 是否为紧急任务，影响渲染风格
     id: str = ""
+    # 渲染缓存：标题和颜色在任务生命周期内不可变，测量/解析一次即可
+    # (slots 下动态属性不可用，必须在这里声明)
+    _title_w: int = field(default=-1, init=False, repr=False, compare=False)
+    _qcolor: QColor = field(default=None, init=False, repr=False, compare=False)
+    _elided_key: tuple = field(default=None, init=False, repr=False, compare=False)
+    _elided: str = field(default="", init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if not self.id:
-            self.id = str(uuid.uuid4())[:8]
+            # 8 位十六进制随机 ID；比构造完整 UUID 对象再切片轻量得多
+            self.id = os.urandom(4).hex()
+
+    def title_width(self, metrics) -> int:
+        if self._title_w < 0:
+            self._title_w = metrics.horizontalAdvance(self.title)
+        return self._title_w
+
+    def qcolor(self) -> QColor:
+        if self._qcolor is None:
+            self._qcolor = QColor(self.color)
+        return self._qcolor
+
+    def elided_title(self, font, metrics, width: int) -> str:
+        # 省略号截断按 (宽度, 字号, 字重) 缓存：同一任务会以不同字体出现在
+        # 网格 (12pt) 和 Backlog (10pt)，只按宽度缓存会串用另一字体的结果
+        key = (width, font.pointSize(), font.weight())
+        if self._elided_key != key:
+            self._elided = metrics.elidedText(self.title, Qt.TextElideMode.ElideRight, width)
+            self._elided_key = key
+        return self._elided
 
     def to_dict(self):
         return {
             "id": self.id,
             "title": self.title,
             "person": self.person,
-            "date": self.date.isoformat(),
+            "date": _iso(self.date),
             "start_hour": self.start_hour,
             "duration": self.duration,
             "color": self.color,
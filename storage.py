@@ -1,20 +1,45 @@
 import json
+import logging
+import mmap
 import os
 from datetime import date, timedelta
 from typing import List, Optional
+
+# orjson (Rust 实现) 序列化/解析比 stdlib json 快一个量级，且直接产出 bytes；
+# 可选依赖，缺席时退回 stdlib，行为一致
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from PyQt6.QtCore import QCoreApplication, QTimer
+
 from models import User, Task, TaskStatus
 
 DATA_FILE = "data/schedule_data.json"
 
+log = logging.getLogger(__name__)
+
 class DataManager:
+    _dir_ensured = False # 类级一次性标记，跨实例只建一次目录
+
     def __init__(self):
         self.users: List[User] = []
         self.tasks: List[Task] = []
-        self.ensure_data_dir()
+        # id -> Task 索引，避免按 id 查找时线性扫描
+        self._tasks_by_id: dict = {}
+        # 批量变更合并落盘的脏标记
+        self._save_dirty = False
+        # 上次成功写出的 payload 哈希，内容没变就跳过整个写盘
+        self._last_hash = None
+        # 上次成功加载时数据文件的 (mtime_ns, size)，文件没动就不重复解析
+        self._load_key = None
 
     def ensure_data_dir(self):
-        if not os.path.exists("data"):
-            os.makedirs("data")
+        # 懒执行：只有真要写盘时才需要目录存在，纯读场景省掉 syscall
+        if not DataManager._dir_ensured:
+            os.makedirs("data", exist_ok=True)
+            DataManager._dir_ensured = True
 
     def load_data(self):
         if not os.path.exists(DATA_FILE):
@@ -23,24 +48,123 @@ class DataManager:
             return
 
         try:
-            with open(DATA_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                self.users = [User.from_dict(u) for u in data.get("users", [])]
-                self.tasks = [Task.from_dict(t) for t in data.get("tasks", [])]
-        except Exception as e:
-            print(f"Error loading data: {e}")
+            # 文件没被改动过就直接复用内存里的对象，免去重复解析
+            st = os.stat(DATA_FILE)
+            load_key = (st.st_mtime_ns, st.st_size)
+            if load_key == self._load_key:
+                return
+
+            # 1MiB 缓冲：整文件读写时把 syscall 次数压到 O(1)
+            with open(DATA_FILE, "rb", buffering=1 << 20) as f:
+                # 提示内核顺序读，放大预读窗口 (Windows 上没有这个调用)
+                if hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                if orjson:
+                    # orjson 接受 memoryview，套在 mmap 上零拷贝解析，省掉一次
+                    # 整文件拷贝进用户态；空文件映射不了，退回常规读取
+                    try:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            data = orjson.loads(memoryview(mm))
+                    except ValueError:
+                        data = orjson.loads(f.read())
+                else:
+                    # stdlib json 只收 str/bytes，mmap 切片照样得拷贝，不值得绕
+                    data = json.loads(f.read())
+            # map + 未绑定方法：省掉每个元素一次的属性查找和帧开销
+            self.users = list(map(User.from_dict, data.get("users", [])))
+            self.tasks = list(map(Task.from_dict, data.get("tasks", [])))
+            self._reindex_tasks()
+            self._load_key = load_key
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            # OSError=读不到文件，ValueError=JSON 坏了 (orjson/stdlib 的
+            # DecodeError 都是其子类)，KeyError/TypeError/AttributeError=
+            # JSON 合法但形状不对 (字段缺失、列表里混进标量、顶层不是对象
+            # 等，from_dict/get 在这类数据上抛的就是这三种)；其余异常是
+            # 编程错误，照常抛出别吞掉
+            log.exception("加载数据失败，回退到演示数据")
             self.load_demo_data()
 
-    def save_data(self):
+    def _reindex_tasks(self):
+        self._tasks_by_id = {t.id: t for t in self.tasks}
+
+    def add_task(self, task: Task):
+        self.tasks.append(task)
+        self._tasks_by_id[task.id] = task
+        self.save_data()
+
+    def get_task(self, task_id: str) -> Optional[Task]:
+        return self._tasks_by_id.get(task_id)
+
+    def get_all_tasks(self) -> List[Task]:
+        # tasks 始终按创建顺序追加，直接返回即可，调用方不要排序
+        return self.tasks
+
+    def _encode(self, pretty=False) -> bytes:
+        # 先整体编码再单次写出，避免 json.dump 按 token 反复调用 f.write；
+        # 机器读的文件默认紧凑格式，pretty 仅供人工排查
         data = {
-            "users": [u.to_dict() for u in self.users],
-            "tasks": [t.to_dict() for t in self.tasks]
+            "users": list(map(User.to_dict, self.users)),
+            "tasks": list(map(Task.to_dict, self.tasks))
         }
+        if orjson:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2) if pretty \
+                else orjson.dumps(data)
+        if pretty:
+            return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def dump_pretty(self, path: str):
+        """把当前内存数据美化输出到指定路径，人工排查数据问题用"""
+        with open(path, "wb") as f:
+            f.write(self._encode(pretty=True))
+
+    def save_data(self, pretty=False, durable=False):
         try:
-            with open(DATA_FILE, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            print(f"Error saving data: {e}")
+            payload = self._encode(pretty)
+            # 内容与上次落盘完全一致时直接返回 (如重复触发的保存回调)
+            payload_hash = hash(payload)
+            if payload_hash == self._last_hash:
+                return True
+            self.ensure_data_dir()
+            # 先写临时文件再原子换名：中途崩溃也不会留下截断的数据文件；
+            # rename 的原子性已经够用，fsync 只在调用方明确要求持久化时才付
+            tmp = DATA_FILE + ".tmp"
+            # payload 已是完整 bytes，绕开文件对象的缓冲/加锁层直接 os.write；
+            # 典型体量一个 syscall 写完，循环只为兜底部分写
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                mv = memoryview(payload)
+                n = 0
+                while n < len(mv):
+                    n += os.write(fd, mv[n:])
+                if durable:
+                    os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp, DATA_FILE)
+            self._last_hash = payload_hash
+            return True
+        except OSError:
+            # 磁盘问题不该把整个 GUI 带崩，记日志并告知调用方失败即可
+            log.exception("保存数据失败")
+            return False
+
+    def _mark_dirty(self):
+        """合并 200ms 窗口内的多次变更为一次 save_data (如链式添加人员)"""
+        if QCoreApplication.instance() is None:
+            # 没有事件循环就没法延迟，直接写
+            self.save_data()
+            return
+        if self._save_dirty:
+            return
+        self._save_dirty = True
+        QTimer.singleShot(200, self.flush)
+
+    def flush(self):
+        """立即写出挂起的变更 (退出前调用)"""
+        if self._save_dirty:
+            self._save_dirty = False
+            self.save_data()
 
     def get_next_emp_id(self) -> str:
         # 简单查找最大整数 ID
@@ -62,7 +186,7 @@ class DataManager:
                 if u.emp_id == target_id:
                     u.name = name # 更新名字
                     u.is_active = True
-                    self.save_data()
+                    self._mark_dirty()
                     return u
         
         # 2. 尝试按名字查找 (如果没指定ID)
@@ -70,7 +194,7 @@ class DataManager:
             for u in self.users:
                 if u.name == name:
                     u.is_active = True
-                    self.save_data()
+                    self._mark_dirty()
                     return u
             # 生成新 ID
             target_id = self.get_next_emp_id()
@@ -78,7 +202,7 @@ class DataManager:
         # 3. 创建新用户
         new_user = User(emp_id=target_id, name=name, is_active=True)
         self.users.append(new_user)
-        self.save_data()
+        self._mark_dirty()
         return new_user
 
     def soft_delete_user(self, emp_id: str):
@@ -86,7 +210,7 @@ class DataManager:
             if u.emp_id == emp_id:
                 u.is_active = False
                 break
-        self.save_data()
+        self._mark_dirty()
 
     def load_demo_data(self):
         # 迁移旧的 demo 数据逻辑到这里
@@ -111,3 +235,4 @@ class DataManager:
         t_backlog_1 = Task("整理工具箱", "", today, scheduled=False, urgent=False)
 
         self.tasks = [t1, t2, t3, t4, t5, t_backlog_1]
+        self._reindex_tasks()